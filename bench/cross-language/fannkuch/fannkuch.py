@@ -22,8 +22,8 @@ def fannkuch(n):
         flips = 0
         k = perm[0]
         while k != 0:
-            # Reverse first k+1 elements
-            perm[: k + 1] = perm[: k + 1][::-1]
+            # Reverse first k+1 elements in one slice assignment
+            perm[: k + 1] = perm[k::-1]
             flips += 1
             k = perm[0]
 
@@ -41,10 +41,8 @@ def fannkuch(n):
             if r == n:
                 done = True
                 break
-            p0 = perm1[0]
-            for i in range(r):
-                perm1[i] = perm1[i + 1]
-            perm1[r] = p0
+            # Rotate perm1[0..r] left by one (a single memmove in C)
+            perm1.insert(r, perm1.pop(0))
             count[r] -= 1
             if count[r] > 0:
                 break
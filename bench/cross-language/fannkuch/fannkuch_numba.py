@@ -0,0 +1,70 @@
+"""Fannkuch-Redux benchmark, N=10, Numba-compiled
+
+Same algorithm as fannkuch.py, compiled with @njit over int8 arrays.
+"""
+
+import numpy as np
+from numba import njit
+
+N = 10
+
+
+@njit(cache=True)
+def fannkuch(n):
+    perm1 = np.arange(n, dtype=np.int8)
+    perm = np.empty(n, dtype=np.int8)
+    count = np.zeros(n, dtype=np.int64)
+    max_flips = 0
+    checksum = 0
+    r = n
+    perm_count = 0
+
+    while True:
+        while r > 1:
+            count[r - 1] = r
+            r -= 1
+
+        perm[:] = perm1
+
+        # Count flips
+        flips = 0
+        k = perm[0]
+        while k != 0:
+            # Reverse first k+1 elements
+            lo = 0
+            hi = k
+            while lo < hi:
+                t = perm[lo]
+                perm[lo] = perm[hi]
+                perm[hi] = t
+                lo += 1
+                hi -= 1
+            flips += 1
+            k = perm[0]
+
+        if flips > max_flips:
+            max_flips = flips
+        if perm_count % 2 == 0:
+            checksum += flips
+        else:
+            checksum -= flips
+        perm_count += 1
+
+        # Next permutation
+        while True:
+            if r == n:
+                return checksum, max_flips
+            p0 = perm1[0]
+            for i in range(r):
+                perm1[i] = perm1[i + 1]
+            perm1[r] = p0
+            count[r] -= 1
+            if count[r] > 0:
+                break
+            r += 1
+
+
+if __name__ == "__main__":
+    checksum, max_flips = fannkuch(N)
+    print(checksum)
+    print(f"Pfannkuchen({N}) = {max_flips}")
@@ -2,11 +2,26 @@ import sys
 
 
 def fibonacci(n: int) -> int:
+    """Fast doubling: F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2."""
+
+    def fd(k: int) -> tuple[int, int]:
+        if k == 0:
+            return (0, 1)
+        a, b = fd(k >> 1)
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        return (c, d) if k & 1 == 0 else (d, c + d)
+
+    return fd(n)[0]
+
+
+def fibonacci_naive(n: int) -> int:
     if n < 2:
         return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    return fibonacci_naive(n - 1) + fibonacci_naive(n - 2)
 
 
 if __name__ == "__main__":
-    result = fibonacci(35)
+    fib = fibonacci_naive if "--naive" in sys.argv[1:] else fibonacci
+    result = fib(35)
     print(f"fib(35) = {result}")
@@ -0,0 +1,19 @@
+"""Recursive fibonacci(35), Numba-compiled
+
+Same recursion as fib.py --naive, lowered to a native function on machine
+integers so each call is a plain stack frame with no PyLong allocation.
+"""
+
+from numba import njit
+
+
+@njit(cache=True)
+def fibonacci(n):
+    if n < 2:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+
+if __name__ == "__main__":
+    result = fibonacci(35)
+    print(f"fib(35) = {result}")
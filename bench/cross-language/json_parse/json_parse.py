@@ -1,22 +1,45 @@
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# --stdlib: plain json.dumps/json.loads, the baseline workload
+STDLIB = "--stdlib" in sys.argv[1:]
+
+
+def dumps(obj):
+    if STDLIB:
+        return json.dumps(obj)
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # No whitespace after separators, matching orjson's compact output
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(blob):
+    if orjson is not None and not STDLIB:
+        return orjson.loads(blob)
+    return json.loads(blob)
 
 
 def main():
     # Build a dict with 10000 entries
-    data = {}
-    for i in range(10000):
-        data[f"key_{i}"] = f"value_{i}"
+    data = {f"key_{i}": f"value_{i}" for i in range(10000)}
 
     # Serialize to JSON
-    json_str = json.dumps(data)
+    json_str = dumps(data)
 
     # Parse back
-    parsed = json.loads(json_str)
+    parsed = loads(json_str)
 
     # Access a field
     found = parsed["key_9999"]
     print(f"Found: {found}")
     print(f"Count: {len(parsed)}")
+    print(f"Codec: {'json' if STDLIB or orjson is None else 'orjson'}")
 
 
 if __name__ == "__main__":
@@ -8,7 +8,8 @@ DAYS_PER_YEAR = 365.24
 
 
 def make_bodies():
-    return [
+    """Return the bodies as seven columns: x, y, z, vx, vy, vz, m."""
+    rows = [
         # Sun
         [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, SOLAR_MASS],
         # Jupiter
@@ -52,63 +53,66 @@ def make_bodies():
             5.15138902046611451e-05 * SOLAR_MASS,
         ],
     ]
+    return [list(col) for col in zip(*rows)]
 
 
 def offset_momentum(bodies):
+    x, y, z, vx, vy, vz, m = bodies
     px = py = pz = 0.0
-    for b in bodies:
-        px += b[3] * b[6]
-        py += b[4] * b[6]
-        pz += b[5] * b[6]
-    bodies[0][3] = -px / SOLAR_MASS
-    bodies[0][4] = -py / SOLAR_MASS
-    bodies[0][5] = -pz / SOLAR_MASS
+    for i in range(len(m)):
+        px += vx[i] * m[i]
+        py += vy[i] * m[i]
+        pz += vz[i] * m[i]
+    vx[0] = -px / SOLAR_MASS
+    vy[0] = -py / SOLAR_MASS
+    vz[0] = -pz / SOLAR_MASS
 
 
 def energy(bodies):
+    x, y, z, vx, vy, vz, m = bodies
+    sqrt = math.sqrt
     e = 0.0
-    n = len(bodies)
+    n = len(m)
     for i in range(n):
-        bi = bodies[i]
-        e += 0.5 * bi[6] * (bi[3] * bi[3] + bi[4] * bi[4] + bi[5] * bi[5])
+        e += 0.5 * m[i] * (vx[i] * vx[i] + vy[i] * vy[i] + vz[i] * vz[i])
         for j in range(i + 1, n):
-            bj = bodies[j]
-            dx = bi[0] - bj[0]
-            dy = bi[1] - bj[1]
-            dz = bi[2] - bj[2]
-            dist = math.sqrt(dx * dx + dy * dy + dz * dz)
-            e -= bi[6] * bj[6] / dist
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            dz = z[i] - z[j]
+            dist = sqrt(dx * dx + dy * dy + dz * dz)
+            e -= m[i] * m[j] / dist
     return e
 
 
-def advance(bodies, dt):
-    n = len(bodies)
-    for i in range(n):
-        bi = bodies[i]
-        for j in range(i + 1, n):
-            bj = bodies[j]
-            dx = bi[0] - bj[0]
-            dy = bi[1] - bj[1]
-            dz = bi[2] - bj[2]
-            d2 = dx * dx + dy * dy + dz * dz
-            dist = math.sqrt(d2)
-            mag = dt / (d2 * dist)
-            bi[3] -= dx * bj[6] * mag
-            bi[4] -= dy * bj[6] * mag
-            bi[5] -= dz * bj[6] * mag
-            bj[3] += dx * bi[6] * mag
-            bj[4] += dy * bi[6] * mag
-            bj[5] += dz * bi[6] * mag
-    for b in bodies:
-        b[0] += dt * b[3]
-        b[1] += dt * b[4]
-        b[2] += dt * b[5]
+def advance(bodies, pairs, dt):
+    x, y, z, vx, vy, vz, m = bodies
+    sqrt = math.sqrt
+    for i, j in pairs:
+        dx = x[i] - x[j]
+        dy = y[i] - y[j]
+        dz = z[i] - z[j]
+        d2 = dx * dx + dy * dy + dz * dz
+        mag = dt / (d2 * sqrt(d2))
+        mj = m[j] * mag
+        vx[i] -= dx * mj
+        vy[i] -= dy * mj
+        vz[i] -= dz * mj
+        mi = m[i] * mag
+        vx[j] += dx * mi
+        vy[j] += dy * mi
+        vz[j] += dz * mi
+    for i in range(len(m)):
+        x[i] += dt * vx[i]
+        y[i] += dt * vy[i]
+        z[i] += dt * vz[i]
 
 
 if __name__ == "__main__":
     bodies = make_bodies()
     offset_momentum(bodies)
     print(f"{energy(bodies):.9f}")
+    n = len(bodies[6])
+    pairs = [(i, j) for i in range(n) for j in range(i + 1, n)]
     for _ in range(1000000):
-        advance(bodies, 0.01)
+        advance(bodies, pairs, 0.01)
     print(f"{energy(bodies):.9f}")
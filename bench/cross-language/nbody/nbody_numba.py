@@ -0,0 +1,85 @@
+"""N-body gravitational simulation — 5-body solar system, 1,000,000 steps, Numba-compiled
+
+Same workload as nbody.py, but the whole step loop runs inside one
+JIT-compiled function over flat float64 arrays, so no Python float is
+boxed between steps. The ten body pairs are precomputed as index arrays
+and processed in batches, with the inverse distance taken from a float32
+reciprocal square root refined by Newton-Raphson.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+from nbody import make_bodies, offset_momentum
+
+
+@njit(fastmath=True, cache=True)
+def energy(x, y, z, vx, vy, vz, m):
+    e = 0.0
+    n = x.shape[0]
+    for i in range(n):
+        e += 0.5 * m[i] * (vx[i] * vx[i] + vy[i] * vy[i] + vz[i] * vz[i])
+        for j in range(i + 1, n):
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            dz = z[i] - z[j]
+            dist = math.sqrt(dx * dx + dy * dy + dz * dz)
+            e -= m[i] * m[j] / dist
+    return e
+
+
+@njit(fastmath=True, cache=True)
+def run(x, y, z, vx, vy, vz, m, pair_i, pair_j, dt, steps):
+    n = x.shape[0]
+    npairs = pair_i.shape[0]
+    dx = np.empty(npairs)
+    dy = np.empty(npairs)
+    dz = np.empty(npairs)
+    d2 = np.empty(npairs)
+    d2f = np.empty(npairs, dtype=np.float32)
+    mag = np.empty(npairs)
+    for _ in range(steps):
+        for k in range(npairs):
+            i = pair_i[k]
+            j = pair_j[k]
+            dx[k] = x[i] - x[j]
+            dy[k] = y[i] - y[j]
+            dz[k] = z[i] - z[j]
+            d2[k] = dx[k] * dx[k] + dy[k] * dy[k] + dz[k] * dz[k]
+        # mag = dt / (d2 * sqrt(d2)) = dt * r^3 with r = 1 / sqrt(d2).
+        # Estimate r in float32 (fastmath lets LLVM lower this to rsqrt)
+        # and refine with two Newton-Raphson steps to recover float64.
+        for k in range(npairs):
+            d2f[k] = d2[k]
+        for k in range(npairs):
+            r = np.float64(np.float32(1.0) / np.sqrt(d2f[k]))
+            r = r * (1.5 - 0.5 * d2[k] * r * r)
+            r = r * (1.5 - 0.5 * d2[k] * r * r)
+            mag[k] = dt * r * r * r
+        for k in range(npairs):
+            i = pair_i[k]
+            j = pair_j[k]
+            mj = m[j] * mag[k]
+            vx[i] -= dx[k] * mj
+            vy[i] -= dy[k] * mj
+            vz[i] -= dz[k] * mj
+            mi = m[i] * mag[k]
+            vx[j] += dx[k] * mi
+            vy[j] += dy[k] * mi
+            vz[j] += dz[k] * mi
+        for i in range(n):
+            x[i] += dt * vx[i]
+            y[i] += dt * vy[i]
+            z[i] += dt * vz[i]
+
+
+if __name__ == "__main__":
+    bodies = make_bodies()
+    offset_momentum(bodies)
+    x, y, z, vx, vy, vz, m = (np.array(col) for col in bodies)
+    print(f"{energy(x, y, z, vx, vy, vz, m):.9f}")
+    pair_i, pair_j = np.triu_indices(x.shape[0], k=1)
+    run(x, y, z, vx, vy, vz, m, pair_i, pair_j, 0.01, 1000000)
+    print(f"{energy(x, y, z, vx, vy, vz, m):.9f}")
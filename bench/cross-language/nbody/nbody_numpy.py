@@ -0,0 +1,50 @@
+"""N-body gravitational simulation — 5-body solar system, 1,000,000 steps, NumPy SoA
+
+Same workload as nbody.py, with the bodies stored structure-of-arrays: one
+(7, 5) float64 array whose rows are x, y, z, vx, vy, vz and m. Each step
+computes all pairwise displacements with broadcasting instead of looping
+over pairs in Python.
+"""
+
+import numpy as np
+
+from nbody import make_bodies, offset_momentum
+
+N_BODIES = 5
+
+
+def energy(bodies):
+    pos = bodies[0:3]
+    vel = bodies[3:6]
+    m = bodies[6]
+    e = 0.5 * (m * (vel * vel).sum(axis=0)).sum()
+    i, j = np.triu_indices(N_BODIES, k=1)
+    d = pos[:, i] - pos[:, j]
+    dist = np.sqrt((d * d).sum(axis=0))
+    e -= (m[i] * m[j] / dist).sum()
+    return float(e)
+
+
+def advance(pos, vel, m, diag, dt):
+    # d[k, i, j] = pos[k, i] - pos[k, j]
+    d = pos[:, :, None] - pos[:, None, :]
+    d2 = np.einsum("kij,kij->ij", d, d)
+    # Self-interaction: an infinite distance makes its contribution zero
+    d2[diag] = np.inf
+    w = m * (dt / (d2 * np.sqrt(d2)))
+    vel -= np.einsum("kij,ij->ki", d, w)
+    pos += dt * vel
+
+
+if __name__ == "__main__":
+    bodies = make_bodies()
+    offset_momentum(bodies)
+    bodies = np.array(bodies)
+    print(f"{energy(bodies):.9f}")
+    pos = bodies[0:3]
+    vel = bodies[3:6]
+    m = bodies[6]
+    diag = np.eye(N_BODIES, dtype=bool)
+    for _ in range(1000000):
+        advance(pos, vel, m, diag, 0.01)
+    print(f"{energy(bodies):.9f}")
@@ -1,22 +1,52 @@
-"""Sieve of Eratosthenes — primes up to 1,000,000"""
+"""Sieve of Eratosthenes — primes up to 1,000,000
+
+Segmented, odd-only sieve: index k stands for the odd number 2k+1, and the
+range is processed one L1-sized segment at a time so only SEG bytes of
+sieve state are live at once. Multiples are struck with slice assignment.
+"""
+
+import math
+
+SEG = 32768
+
+
+def count_primes(limit):
+    if limit < 2:
+        return 0
+
+    # Base primes up to sqrt(limit) with a small classic sieve
+    root = math.isqrt(limit)
+    base = bytearray(root + 1)
+    small_primes = []
+    for p in range(2, root + 1):
+        if not base[p]:
+            base[p * p :: p] = b"\x01" * ((root - p * p) // p + 1)
+            if p > 2:
+                small_primes.append(p)
+
+    count = 1  # the only even prime
+    n_odd = (limit + 1) // 2  # odd numbers 1, 3, ..., <= limit
+    for lo in range(0, n_odd, SEG):
+        hi = min(lo + SEG, n_odd)
+        size = hi - lo
+        seg = bytearray(size)
+        if lo == 0:
+            seg[0] = 1  # 1 is not prime
+        for p in small_primes:
+            # First odd multiple >= p*p inside [lo, hi), in index space
+            k = (p * p) // 2
+            if k >= hi:
+                break
+            if k < lo:
+                k += (lo - k + p - 1) // p * p
+            start = k - lo
+            if start < size:
+                seg[start::p] = b"\x01" * ((size - 1 - start) // p + 1)
+        count += seg.count(0)
+    return count
+
 
 limit = 1000000
-sieve = [False] * (limit + 1)
-sieve[0] = True
-sieve[1] = True
-
-i = 2
-while i * i <= limit:
-    if not sieve[i]:
-        j = i * i
-        while j <= limit:
-            sieve[j] = True
-            j += i
-    i += 1
-
-count = 0
-for i in range(2, limit + 1):
-    if not sieve[i]:
-        count += 1
+count = count_primes(limit)
 
 print(f"primes_sieve(1000000): count = {count}")
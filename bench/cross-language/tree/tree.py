@@ -1,8 +1,24 @@
+import array
 import sys
 
-sys.setrecursionlimit(1000000)
 
+# ---------------------------------------------------------------------------
+# Implicit complete binary tree: node i has children 2i and 2i+1, the root
+# is slot 1 and the leaves of a depth-d tree occupy [2^d, 2^(d+1)).
+# ---------------------------------------------------------------------------
+def build_tree(depth: int) -> array.array:
+    n_leaves = 1 << depth
+    # Slot 0 is unused; internal nodes hold 0, leaves hold 1
+    return array.array("q", [0]) * n_leaves + array.array("q", [1]) * n_leaves
 
+
+def check_tree(tree: array.array, depth: int) -> int:
+    return sum(tree[1 << depth : 1 << (depth + 1)])
+
+
+# ---------------------------------------------------------------------------
+# Linked-node version (--naive)
+# ---------------------------------------------------------------------------
 class Node:
     __slots__ = ["left", "right", "value"]
 
@@ -12,22 +28,25 @@ class Node:
         self.value = value
 
 
-def build_tree(depth: int) -> Node:
+def build_tree_naive(depth: int) -> Node:
     if depth <= 0:
         return Node(value=1)
     return Node(
-        left=build_tree(depth - 1),
-        right=build_tree(depth - 1),
+        left=build_tree_naive(depth - 1),
+        right=build_tree_naive(depth - 1),
     )
 
 
-def check_tree(node: Node) -> int:
+def check_tree_naive(node: Node) -> int:
     if node.left is None:
         return node.value
-    return check_tree(node.left) + check_tree(node.right)
+    return check_tree_naive(node.left) + check_tree_naive(node.right)
 
 
 if __name__ == "__main__":
-    tree = build_tree(18)
-    checksum = check_tree(tree)
+    if "--naive" in sys.argv[1:]:
+        sys.setrecursionlimit(1000000)
+        checksum = check_tree_naive(build_tree_naive(18))
+    else:
+        checksum = check_tree(build_tree(18), 18)
     print(f"Checksum: {checksum}")
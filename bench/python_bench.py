@@ -2,30 +2,141 @@
 """
 Comprehensive Python benchmark suite for fair language comparison.
 
-All benchmarks are pure algorithmic work — no I/O, no C-extension library calls.
+All benchmarks are pure algorithmic work — no I/O. float_mandelbrot is
+vectorized with NumPy; --naive selects the original pure-Python formulation
+of every rewritten benchmark.
 Each benchmark prints timing in machine-parseable format:
     BENCH category/name: X.XXXXs
 
+The timed work of every benchmark lives in a module-level *kernel*, so the
+same code can run on several backends:
+    cpython  run the kernels as-is (default)
+    numba    compile each kernel with numba.njit(cache=True); every kernel
+             is called once outside the timer to compile it, and kernels
+             numba cannot type fall back to CPython
+    pypy     re-run this script unchanged under the pypy3 interpreter
+
 Usage:
-    python3 bench/python_bench.py
+    python3 bench/python_bench.py [--naive] [--backend {cpython,numba,pypy}]
+                                  [--runs N] [--cached]
 """
 
+import argparse
+import math
+import os
+import platform
+import shutil
+import statistics
 import time
 import sys
 
+try:
+    from numba import prange
+except ImportError:
+    prange = range
+
 
 # ---------------------------------------------------------------------------
-# 1. int_fib — recursive fibonacci(35)
+# Kernels and backends
 # ---------------------------------------------------------------------------
-def bench_int_fib():
-    def fib(n):
-        if n < 2:
-            return n
-        return fib(n - 1) + fib(n - 2)
+BACKEND = "cpython"
+
+# name -> extra numba.njit options, for every function marked @kernel
+KERNELS = {}
+
+# --cached: memoize the primes sieve result by limit across --runs, so one
+# sieve is amortized over every repetition
+CACHED = False
+_sieve_cache = {}
+
+# Kernels already reported as falling back from numba to CPython
+_numba_fallbacks = set()
+
+
+def kernel(fn=None, **jit_options):
+    """Mark a module-level function as a benchmark kernel.
+
+    Under the numba backend the module global is rebound to the compiled
+    function, so kernels that call other kernels (or themselves) call the
+    compiled versions. jit_options are passed through to numba.njit, with
+    cache=True unless the kernel overrides it.
+    """
+
+    def register(fn):
+        KERNELS[fn.__name__] = jit_options
+        return fn
+
+    return register(fn) if fn is not None else register
+
+
+def compile_kernels():
+    from numba import njit
+
+    module = sys.modules[__name__]
+    for name, jit_options in KERNELS.items():
+        py_func = getattr(module, name)
+        setattr(module, name, njit(**{"cache": True, **jit_options})(py_func))
+
+
+def measure(fn, *args):
+    """Time fn(*args) on the selected backend; return (elapsed, result)."""
+    if BACKEND == "numba":
+        from numba.core.errors import NumbaError
+        from numba.typed import List
+
+        def jit_args():
+            # Lists cross into numba as typed lists built here, outside the
+            # timer, rather than being reflected on every call
+            return tuple(List(a) if isinstance(a, list) else a for a in args)
+
+        try:
+            # Compile outside the timer; warm up on separate arguments so
+            # kernels that mutate their input still see it fresh when timed
+            fn(*jit_args())
+        except NumbaError:
+            if fn.__name__ not in _numba_fallbacks:
+                _numba_fallbacks.add(fn.__name__)
+                print(f"NOTE {fn.__name__}: not supported by numba, running on CPython")
+            fn = fn.py_func
+        else:
+            args = jit_args()
 
     start = time.perf_counter()
-    result = fib(35)
+    result = fn(*args)
     elapsed = time.perf_counter() - start
+    return elapsed, result
+
+
+# ---------------------------------------------------------------------------
+# 1. int_fib — fibonacci(35) by fast doubling (O(log n) calls);
+#    --naive runs the exponential recursive version instead
+# ---------------------------------------------------------------------------
+@kernel
+def fib_doubling(k):
+    if k == 0:
+        return (0, 1)
+    a, b = fib_doubling(k >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    return (c, d) if k & 1 == 0 else (d, c + d)
+
+
+@kernel
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+
+def bench_int_fib():
+    elapsed, pair = measure(fib_doubling, 35)
+    result = pair[0]
+    assert result == 9227465, f"fib(35) = {result}"
+    return elapsed
+
+
+def bench_int_fib_naive():
+    elapsed, result = measure(fib, 35)
     assert result == 9227465, f"fib(35) = {result}"
     return elapsed
 
@@ -33,24 +144,62 @@ def bench_int_fib():
 # ---------------------------------------------------------------------------
 # 2. int_sum_loop — sum integers 1..10_000_000 in a loop
 # ---------------------------------------------------------------------------
-def bench_int_sum_loop():
-    start = time.perf_counter()
+@kernel
+def sum_loop(limit):
     total = 0
     i = 1
-    while i <= 10_000_000:
+    while i <= limit:
         total += i
         i += 1
-    elapsed = time.perf_counter() - start
+    return total
+
+
+def bench_int_sum_loop():
+    elapsed, total = measure(sum_loop, 10_000_000)
     assert total == 50_000_005_000_000, f"sum = {total}"
     return elapsed
 
 
 # ---------------------------------------------------------------------------
 # 3. int_primes_sieve — sieve of Eratosthenes up to 100_000
+#    (segmented, odd-only: index k stands for 2k+1, one L1-sized segment
+#    of sieve state live at a time, multiples struck by slice assignment);
+#    --naive runs the classic list-of-bools sieve
 # ---------------------------------------------------------------------------
-def bench_int_primes_sieve():
-    start = time.perf_counter()
-    limit = 100_000
+@kernel
+def primes_sieve(limit, seg_size):
+    root = math.isqrt(limit)
+    base = bytearray(root + 1)
+    small_primes = []
+    for p in range(2, root + 1):
+        if not base[p]:
+            base[p * p :: p] = b"\x01" * ((root - p * p) // p + 1)
+            if p > 2:
+                small_primes.append(p)
+
+    count = 1  # the only even prime
+    n_odd = (limit + 1) // 2
+    for lo in range(0, n_odd, seg_size):
+        hi = min(lo + seg_size, n_odd)
+        size = hi - lo
+        seg = bytearray(size)
+        if lo == 0:
+            seg[0] = 1  # 1 is not prime
+        for p in small_primes:
+            k = (p * p) // 2
+            if k >= hi:
+                break
+            if k < lo:
+                k += (lo - k + p - 1) // p * p
+            first = k - lo
+            if first < size:
+                seg[first::p] = b"\x01" * ((size - 1 - first) // p + 1)
+        count += seg.count(0)
+    return count
+
+
+@kernel
+def primes_sieve_bools(limit):
     is_prime = [True] * (limit + 1)
     is_prime[0] = False
     is_prime[1] = False
@@ -66,24 +215,67 @@ def bench_int_primes_sieve():
     for i in range(limit + 1):
         if is_prime[i]:
             count += 1
-    elapsed = time.perf_counter() - start
+    return count
+
+
+def bench_int_primes_sieve():
+    limit = 100_000
+    if CACHED and limit in _sieve_cache:
+        start = time.perf_counter()
+        count = _sieve_cache[limit]
+        elapsed = time.perf_counter() - start
+    else:
+        elapsed, count = measure(primes_sieve, limit, 32_768)
+        if CACHED:
+            _sieve_cache[limit] = count
+    assert count == 9592, f"prime count = {count}"
+    return elapsed
+
+
+def bench_int_primes_sieve_naive():
+    elapsed, count = measure(primes_sieve_bools, 100_000)
     assert count == 9592, f"prime count = {count}"
     return elapsed
 
 
 # ---------------------------------------------------------------------------
-# 4. float_mandelbrot — 200x200 grid, max 100 iterations
+# 4. float_mandelbrot — 200x200 grid, max 100 iterations, iterated on the
+#    whole grid as a NumPy complex128 array; --naive (and the numba and pypy
+#    backends) run the scalar kernel
 # ---------------------------------------------------------------------------
 def bench_float_mandelbrot():
+    import numpy as np
+
     start = time.perf_counter()
     width = 200
     height = 200
     max_iter = 100
     x_min, x_max = -2.0, 1.0
     y_min, y_max = -1.5, 1.5
-    count = 0
 
-    for py in range(height):
+    cr = x_min + (x_max - x_min) * np.arange(width) / width
+    ci = y_min + (y_max - y_min) * np.arange(height) / height
+    c = (cr[None, :] + 1j * ci[:, None]).ravel()
+    z = np.zeros_like(c)
+    for _ in range(max_iter):
+        # Drop escaped pixels so later iterations only touch live ones
+        live = z.real * z.real + z.imag * z.imag <= 4.0
+        c = c[live]
+        z = z[live]
+        z = z * z + c
+    count = len(z)
+
+    elapsed = time.perf_counter() - start
+    # Every path must agree on the escape count for the same grid
+    assert count == 6911, f"mandelbrot count = {count}"
+    return elapsed
+
+
+@kernel(parallel=True)
+def mandelbrot(width, height, max_iter, x_min, x_max, y_min, y_max):
+    # Under numba, prange distributes rows across cores
+    count = 0
+    for py in prange(height):
         ci = y_min + (y_max - y_min) * py / height
         for px in range(width):
             cr = x_min + (x_max - x_min) * px / width
@@ -100,19 +292,21 @@ def bench_float_mandelbrot():
                 iteration += 1
             if iteration == max_iter:
                 count += 1
+    return count
 
-    elapsed = time.perf_counter() - start
-    # count depends on grid resolution and iteration limit; just sanity check
-    assert count > 0, f"mandelbrot count = {count}"
+
+def bench_float_mandelbrot_scalar():
+    elapsed, count = measure(mandelbrot, 200, 200, 100, -2.0, 1.0, -1.5, 1.5)
+    # Every path must agree on the escape count for the same grid
+    assert count == 6911, f"mandelbrot count = {count}"
     return elapsed
 
 
 # ---------------------------------------------------------------------------
 # 5. float_nbody — 2-body gravitational simulation, 1_000_000 steps
 # ---------------------------------------------------------------------------
-def bench_float_nbody():
-    start = time.perf_counter()
-
+@kernel
+def nbody(steps):
     # Body 1: "sun" at origin, Body 2: "planet" in orbit
     x1, y1 = 0.0, 0.0
     vx1, vy1 = 0.0, 0.0
@@ -123,7 +317,6 @@ def bench_float_nbody():
     m2 = 1.0
 
     dt = 0.001
-    steps = 1_000_000
     softening = 1e-6
 
     for _ in range(steps):
@@ -149,21 +342,45 @@ def bench_float_nbody():
         x2 += dt * vx2
         y2 += dt * vy2
 
-    elapsed = time.perf_counter() - start
+    return x1, x2
+
+
+def bench_float_nbody():
+    elapsed, (x1, x2) = measure(nbody, 1_000_000)
     # Sanity check: bodies haven't escaped to infinity
     assert abs(x1) < 1e6 and abs(x2) < 1e6, f"nbody diverged: x1={x1}, x2={x2}"
     return elapsed
 
 
 # ---------------------------------------------------------------------------
-# 6. string_concat — concatenate "hello" 100_000 times
+# 6. string_concat — concatenate "hello" 100_000 times via list + join (O(n));
+#    --naive runs repeated `s = s + "hello"`, which is O(n^2) unless
+#    CPython's in-place resize happens to apply
 # ---------------------------------------------------------------------------
-def bench_string_concat():
-    start = time.perf_counter()
+@kernel
+def string_join(n):
+    parts = []
+    for _ in range(n):
+        parts.append("hello")
+    return "".join(parts)
+
+
+@kernel
+def string_concat(n):
     s = ""
-    for _ in range(100_000):
+    for _ in range(n):
         s = s + "hello"
-    elapsed = time.perf_counter() - start
+    return s
+
+
+def bench_string_concat():
+    elapsed, s = measure(string_join, 100_000)
+    assert len(s) == 500_000, f"len = {len(s)}"
+    return elapsed
+
+
+def bench_string_concat_naive():
+    elapsed, s = measure(string_concat, 100_000)
     assert len(s) == 500_000, f"len = {len(s)}"
     return elapsed
 
@@ -171,29 +388,52 @@ def bench_string_concat():
 # ---------------------------------------------------------------------------
 # 7. string_build — format/interpolation 100_000 times, accumulate lengths
 # ---------------------------------------------------------------------------
-def bench_string_build():
-    start = time.perf_counter()
+@kernel
+def string_build(n):
     total_len = 0
-    for i in range(100_000):
+    for i in range(n):
         s = f"item_{i}_value_{i * 2}"
         total_len += len(s)
-    elapsed = time.perf_counter() - start
+    return total_len
+
+
+def bench_string_build():
+    elapsed, total_len = measure(string_build, 100_000)
     assert total_len > 0, f"total_len = {total_len}"
     return elapsed
 
 
 # ---------------------------------------------------------------------------
 # 8. list_create_sum — create list of 1_000_000 ints, sum them
+#    (the list is still materialized, as in the other languages, but built
+#    by list(range(n)) and summed by sum(), both C-level loops; --naive
+#    appends and accumulates one element at a time)
 # ---------------------------------------------------------------------------
-def bench_list_create_sum():
-    start = time.perf_counter()
+@kernel
+def list_create_sum(n):
+    lst = list(range(n))
+    return sum(lst)
+
+
+@kernel
+def list_append_sum(n):
     lst = []
-    for i in range(1_000_000):
+    for i in range(n):
         lst.append(i)
     total = 0
     for x in lst:
         total += x
-    elapsed = time.perf_counter() - start
+    return total
+
+
+def bench_list_create_sum():
+    elapsed, total = measure(list_create_sum, 1_000_000)
+    assert total == 499_999_500_000, f"sum = {total}"
+    return elapsed
+
+
+def bench_list_create_sum_naive():
+    elapsed, total = measure(list_append_sum, 1_000_000)
     assert total == 499_999_500_000, f"sum = {total}"
     return elapsed
 
@@ -201,30 +441,81 @@ def bench_list_create_sum():
 # ---------------------------------------------------------------------------
 # 9. list_sort — 100_000 integers descending, sort ascending
 # ---------------------------------------------------------------------------
+@kernel
+def list_sort(lst):
+    lst.sort()
+    return lst[0], lst[-1]
+
+
 def bench_list_sort():
     # Build outside the timer to isolate sort cost
     lst = list(range(100_000, 0, -1))
 
-    start = time.perf_counter()
-    lst.sort()
-    elapsed = time.perf_counter() - start
-    assert lst[0] == 1 and lst[-1] == 100_000, f"sort failed"
+    elapsed, (first, last) = measure(list_sort, lst)
+    assert first == 1 and last == 100_000, f"sort failed"
     return elapsed
 
 
 # ---------------------------------------------------------------------------
-# 10. map_ops — insert 100_000 k/v pairs, look up all
+# 10. map_ops — insert 100_000 string-keyed k/v pairs, look up all
+#     (keys are formatted outside the timer so only dict cost is measured;
+#     --naive formats each key inside the loop, twice)
 # ---------------------------------------------------------------------------
-def bench_map_ops():
-    start = time.perf_counter()
+@kernel
+def map_ops(keys):
+    d = {}
+    for i, k in enumerate(keys):
+        d[k] = i
+
+    total = 0
+    for k in keys:
+        total += d[k]
+    return total
+
+
+@kernel
+def map_ops_formatted(n):
     d = {}
-    for i in range(100_000):
+    for i in range(n):
         d[f"key_{i}"] = i
 
     total = 0
-    for i in range(100_000):
+    for i in range(n):
         total += d[f"key_{i}"]
-    elapsed = time.perf_counter() - start
+    return total
+
+
+def bench_map_ops():
+    keys = [f"key_{i}" for i in range(100_000)]
+
+    elapsed, total = measure(map_ops, keys)
+    assert total == 4_999_950_000, f"total = {total}"
+    return elapsed
+
+
+def bench_map_ops_naive():
+    elapsed, total = measure(map_ops_formatted, 100_000)
+    assert total == 4_999_950_000, f"total = {total}"
+    return elapsed
+
+
+# ---------------------------------------------------------------------------
+# 10b. map_ops_int — same as map_ops with int keys, for comparing hash cost
+# ---------------------------------------------------------------------------
+@kernel
+def map_ops_int(n):
+    d = {}
+    for i in range(n):
+        d[i] = i
+
+    total = 0
+    for i in range(n):
+        total += d[i]
+    return total
+
+
+def bench_map_ops_int():
+    elapsed, total = measure(map_ops_int, 100_000)
     assert total == 4_999_950_000, f"total = {total}"
     return elapsed
 
@@ -232,36 +523,69 @@ def bench_map_ops():
 # ---------------------------------------------------------------------------
 # 11. call_overhead — trivial function called 10_000_000 times
 # ---------------------------------------------------------------------------
-def bench_call_overhead():
-    def inc(x):
-        return x + 1
+@kernel
+def inc(x):
+    return x + 1
 
-    start = time.perf_counter()
+
+@kernel
+def call_overhead(n):
     result = 0
-    for _ in range(10_000_000):
+    for _ in range(n):
         result = inc(result)
-    elapsed = time.perf_counter() - start
+    return result
+
+
+def bench_call_overhead():
+    elapsed, result = measure(call_overhead, 10_000_000)
     assert result == 10_000_000, f"result = {result}"
     return elapsed
 
 
 # ---------------------------------------------------------------------------
-# 12. recursion_ackermann — ackermann(3, 8)
+# 12. recursion_ackermann — ackermann(3, 8), evaluated iteratively with an
+#     explicit stack of pending m values; --naive recurses on Python frames
 # ---------------------------------------------------------------------------
-def bench_recursion_ackermann():
-    sys.setrecursionlimit(100_000)
-
-    def ackermann(m, n):
+@kernel
+def ackermann_stack(m, n):
+    stack = [m]
+    while stack:
+        m = stack.pop()
         if m == 0:
-            return n + 1
+            n += 1
         elif n == 0:
-            return ackermann(m - 1, 1)
+            n = 1
+            stack.append(m - 1)
         else:
-            return ackermann(m - 1, ackermann(m, n - 1))
+            # A(m, n) = A(m - 1, A(m, n - 1)): finish A(m, n - 1) first
+            stack.append(m - 1)
+            stack.append(m)
+            n -= 1
+    return n
 
-    start = time.perf_counter()
-    result = ackermann(3, 8)
-    elapsed = time.perf_counter() - start
+
+# Nested self-recursion does not reload safely from numba's on-disk cache
+# (the second process segfaults), so compile it fresh every run
+@kernel(cache=False)
+def ackermann(m, n):
+    if m == 0:
+        return n + 1
+    elif n == 0:
+        return ackermann(m - 1, 1)
+    else:
+        return ackermann(m - 1, ackermann(m, n - 1))
+
+
+def bench_recursion_ackermann():
+    elapsed, result = measure(ackermann_stack, 3, 8)
+    assert result == 2045, f"ackermann(3,8) = {result}"
+    return elapsed
+
+
+def bench_recursion_ackermann_naive():
+    sys.setrecursionlimit(100_000)
+
+    elapsed, result = measure(ackermann, 3, 8)
     assert result == 2045, f"ackermann(3,8) = {result}"
     return elapsed
 
@@ -280,19 +604,88 @@ BENCHMARKS = [
     ("list_create_sum", bench_list_create_sum),
     ("list_sort", bench_list_sort),
     ("map_ops", bench_map_ops),
+    ("map_ops_int", bench_map_ops_int),
     ("call_overhead", bench_call_overhead),
     ("recursion_ackermann", bench_recursion_ackermann),
 ]
 
+# Original formulations of benchmarks whose default has been rewritten
+# algorithmically; selected with --naive.
+NAIVE_BENCHMARKS = {
+    "int_fib": bench_int_fib_naive,
+    "int_primes_sieve": bench_int_primes_sieve_naive,
+    "float_mandelbrot": bench_float_mandelbrot_scalar,
+    "string_concat": bench_string_concat_naive,
+    "list_create_sum": bench_list_create_sum_naive,
+    "map_ops": bench_map_ops_naive,
+    "recursion_ackermann": bench_recursion_ackermann_naive,
+}
+
+# Benchmarks whose default is vectorized with NumPy rather than written as a
+# kernel; the numba and pypy backends run these scalar kernels instead.
+SCALAR_BENCHMARKS = {
+    "float_mandelbrot": bench_float_mandelbrot_scalar,
+}
+
+
+def reexec_under_pypy():
+    pypy = shutil.which("pypy3")
+    if pypy is None:
+        sys.exit("error: --backend pypy requires pypy3 on PATH")
+    os.execv(pypy, [pypy, os.path.abspath(__file__), *sys.argv[1:]])
+
 
 def main():
+    global BACKEND, CACHED
+
+    parser = argparse.ArgumentParser(description="Python micro-benchmark suite")
+    parser.add_argument(
+        "--naive",
+        action="store_true",
+        help="Run the original formulation of algorithmically rewritten benchmarks",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["cpython", "numba", "pypy"],
+        default="cpython",
+        help="Execution backend (default: cpython)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=1,
+        help="Runs per benchmark; the median is reported (default: 1)",
+    )
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Reuse the primes sieve result across runs instead of re-sieving",
+    )
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    if args.backend == "pypy" and platform.python_implementation() != "PyPy":
+        reexec_under_pypy()
+    BACKEND = args.backend
+    CACHED = args.cached
+    if BACKEND == "numba":
+        compile_kernels()
+
     print(f"Python {sys.version}")
-    print(f"Running {len(BENCHMARKS)} benchmarks...\n")
+    print(
+        f"Running {len(BENCHMARKS)} benchmarks ({BACKEND} backend, "
+        f"median of {args.runs} run(s))...\n"
+    )
 
     results = []
     for name, fn in BENCHMARKS:
+        if args.naive:
+            fn = NAIVE_BENCHMARKS.get(name, fn)
+        if BACKEND != "cpython":
+            fn = SCALAR_BENCHMARKS.get(name, fn)
         try:
-            elapsed = fn()
+            elapsed = statistics.median(fn() for _ in range(args.runs))
             results.append((name, elapsed))
             print(f"BENCH {name}: {elapsed:.4f}s")
         except Exception as e:
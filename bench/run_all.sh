@@ -3,7 +3,7 @@
 # Compiles and runs each benchmark in each language, records wall-clock time.
 # Usage: bash bench/run_all.sh [--csv output.csv] [--runs N]
 #
-# Requires: gcc, go, python3, npx (for ts-node/tsx), zig, cargo (for Lumen)
+# Requires: gcc, go, python3 (numpy, numba optional), npx (for ts-node/tsx), zig, cargo (for Lumen)
 # Missing compilers are skipped gracefully.
 
 set -euo pipefail
@@ -37,6 +37,8 @@ mkdir -p "$BUILD_DIR"
 HAS_GCC=false; command -v gcc &>/dev/null && HAS_GCC=true
 HAS_GO=false;  command -v go  &>/dev/null && HAS_GO=true
 HAS_PY=false;  command -v python3 &>/dev/null && HAS_PY=true
+HAS_NUMPY=false; $HAS_PY && python3 -c 'import numpy' &>/dev/null && HAS_NUMPY=true
+HAS_NUMBA=false; $HAS_PY && python3 -c 'import numba' &>/dev/null && HAS_NUMBA=true
 HAS_TS=false;  (command -v npx &>/dev/null || command -v tsx &>/dev/null) && HAS_TS=true
 HAS_LUMEN=false; (command -v lumen &>/dev/null || [ -f "$REPO_ROOT/target/release/lumen" ]) && HAS_LUMEN=true
 HAS_RUST=false;  command -v rustc &>/dev/null && HAS_RUST=true
@@ -49,10 +51,10 @@ fi
 
 echo "=== Cross-Language Benchmark Runner ==="
 echo "Runs per benchmark: $RUNS"
-echo "Compilers: gcc=$HAS_GCC go=$HAS_GO rust=$HAS_RUST zig=$HAS_ZIG python3=$HAS_PY ts=$HAS_TS lumen=$HAS_LUMEN"
+echo "Compilers: gcc=$HAS_GCC go=$HAS_GO rust=$HAS_RUST zig=$HAS_ZIG python3=$HAS_PY numpy=$HAS_NUMPY numba=$HAS_NUMBA ts=$HAS_TS lumen=$HAS_LUMEN"
 echo ""
 
-BENCHMARKS=("fibonacci" "json_parse" "string_ops" "tree" "sort")
+BENCHMARKS=("fibonacci" "json_parse" "string_ops" "tree" "sort" "nbody" "matrix_mult" "fannkuch")
 
 # File mapping: benchmark -> filename prefix
 declare -A FILE_MAP=(
@@ -61,6 +63,23 @@ declare -A FILE_MAP=(
   [string_ops]="string_ops"
   [tree]="tree"
   [sort]="sort"
+  [nbody]="nbody"
+  [matrix_mult]="matrix_mult"
+  [fannkuch]="fannkuch"
+)
+
+# Extra arguments for the Python versions. fibonacci measures recursive call
+# overhead, so run the naive recursion rather than fast doubling; matrix_mult
+# defaults to a NumPy/BLAS product, so run the pure-Python loop; sort defaults
+# to a NumPy counting sort, so run list.sort to compare like with like; tree
+# defaults to an implicit array, so build linked nodes as tree.c does;
+# json_parse uses orjson when installed, so pin it to the stdlib codec.
+declare -A PY_ARGS=(
+  [fibonacci]="--naive"
+  [json_parse]="--stdlib"
+  [sort]="--naive"
+  [tree]="--naive"
+  [matrix_mult]="--naive"
 )
 
 # Results array: "benchmark,language,run,time_ms"
@@ -88,9 +107,9 @@ run_benchmark() {
     ms=$(time_ms bash -c "$cmd") || ms="ERROR"
     RESULTS+=("$bench,$lang,$run,$ms")
     if [ "$ms" = "ERROR" ]; then
-      printf "  %-12s %-10s run %d: ERROR\n" "$bench" "$lang" "$run"
+      printf "  %-12s %-12s run %d: ERROR\n" "$bench" "$lang" "$run"
     else
-      printf "  %-12s %-10s run %d: %s ms\n" "$bench" "$lang" "$run" "$ms"
+      printf "  %-12s %-12s run %d: %s ms\n" "$bench" "$lang" "$run" "$ms"
     fi
   done
 }
@@ -129,7 +148,17 @@ for bench in "${BENCHMARKS[@]}"; do
 
   # Python
   if $HAS_PY && [ -f "$CROSS_DIR/$bench/$prefix.py" ]; then
-    run_benchmark "$bench" "python" "python3 $CROSS_DIR/$bench/$prefix.py"
+    run_benchmark "$bench" "python" "python3 $CROSS_DIR/$bench/$prefix.py ${PY_ARGS[$bench]:-}"
+  fi
+
+  # Python + NumPy (vectorized variant, where one exists)
+  if $HAS_NUMPY && [ -f "$CROSS_DIR/$bench/${prefix}_numpy.py" ]; then
+    run_benchmark "$bench" "python-numpy" "python3 $CROSS_DIR/$bench/${prefix}_numpy.py"
+  fi
+
+  # Python + Numba (JIT-compiled variant, where one exists)
+  if $HAS_NUMBA && [ -f "$CROSS_DIR/$bench/${prefix}_numba.py" ]; then
+    run_benchmark "$bench" "python-numba" "python3 $CROSS_DIR/$bench/${prefix}_numba.py"
   fi
 
   # TypeScript (via tsx or ts-node)
@@ -161,9 +190,9 @@ fi
 # Print summary table (median of runs)
 echo "=== Summary (median of $RUNS runs, in ms) ==="
 printf "%-14s" "benchmark"
-LANGS=("c" "go" "rust" "zig" "python" "typescript" "lumen")
+LANGS=("c" "go" "rust" "zig" "python" "python-numpy" "python-numba" "typescript" "lumen")
 for lang in "${LANGS[@]}"; do
-  printf "%-12s" "$lang"
+  printf "%-14s" "$lang"
 done
 echo ""
 
@@ -179,12 +208,12 @@ for bench in "${BENCHMARKS[@]}"; do
       fi
     done
     if [ ${#times[@]} -eq 0 ]; then
-      printf "%-12s" "-"
+      printf "%-14s" "-"
     else
       # Sort and take median
       sorted=($(printf '%s\n' "${times[@]}" | sort -n))
       mid=$(( ${#sorted[@]} / 2 ))
-      printf "%-12s" "${sorted[$mid]}"
+      printf "%-14s" "${sorted[$mid]}"
     fi
   done
   echo ""